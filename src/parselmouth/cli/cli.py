@@ -2,14 +2,9 @@ from typing import Annotated
 import typer
 
 
-from parselmouth.internals.updater_producer import main as updater_producer_main
-from parselmouth.internals.updater import main as updater_main
-from parselmouth.internals.check_one import main as check_one_main
-from parselmouth.internals.updater_merger import main as update_merger_main
-from parselmouth.internals.legacy_mapping import main as legacy_mapping_main
-from parselmouth.internals.mapping_transformer import main as mapping_transformer_main
-from parselmouth.internals.remover import main as remover_main
-
+# only SupportedChannels is imported at module level, typer needs it for the
+# command signatures. subcommand modules are imported inside each command,
+# so only the one being invoked pays for its dependencies
 from parselmouth.internals.channels import SupportedChannels
 
 app = typer.Typer(no_args_is_help=True, pretty_exceptions_enable=False)
@@ -37,6 +32,7 @@ def updater_producer(
     """
     Generate the subdir@letter list.
     """
+    from parselmouth.internals.updater_producer import main as updater_producer_main
 
     updater_producer_main(
         output_dir=output_dir,
@@ -66,6 +62,7 @@ def updater(
     Use `--upload` to enable uploading to S3. ( This is used in CI )
 
     """
+    from parselmouth.internals.updater import main as updater_main
 
     updater_main(
         subdir_letter=subdir_letter,
@@ -86,6 +83,7 @@ def updater_merger(
     This is used to merge all the partial mappings into a single mapping file during the CI run.
 
     """
+    from parselmouth.internals.updater_merger import main as update_merger_main
 
     update_merger_main(output_dir, channel=channel, upload=upload)
 
@@ -95,6 +93,7 @@ def update_mapping_legacy():
     """
     This is used to update compressed files in the repository.
     """
+    from parselmouth.internals.legacy_mapping import main as legacy_mapping_main
 
     legacy_mapping_main()
 
@@ -104,6 +103,9 @@ def update_mapping(channel: SupportedChannels = SupportedChannels.CONDA_FORGE):
     """
     This is used to update compressed files in the repository.
     """
+    from parselmouth.internals.mapping_transformer import (
+        main as mapping_transformer_main,
+    )
 
     mapping_transformer_main(channel=channel)
 
@@ -136,6 +138,7 @@ def check_one(
     Check mapping just for one package.
     You can also upload it to S3.
     """
+    from parselmouth.internals.check_one import main as check_one_main
 
     check_one_main(
         package_name=package_name, subdir=subdir, backend_type=backend, upload=upload
@@ -157,6 +160,7 @@ def remove(
     """
     Yank and remove packages from the index and by it's hash.
     """
+    from parselmouth.internals.remover import main as remover_main
 
     remover_main(
         subdir=subdir,
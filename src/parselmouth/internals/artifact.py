@@ -1,5 +1,7 @@
+import functools
 from pathlib import Path
 import re
+import sys
 from packaging.version import parse
 from parselmouth.internals.utils import normalize
 from typing import Optional
@@ -12,11 +14,23 @@ from parselmouth.internals.s3 import MappingEntry
 dist_info_pattern = r"([^/]+)-(\d+[^/]*)\.dist-info\/METADATA"
 egg_info_pattern = r"([^/]+?)-(\d+[^/]*)\.egg-info\/PKG-INFO"
 
-dist_pattern_compiled = re.compile(dist_info_pattern)
-egg_pattern_compiled = re.compile(egg_info_pattern)
+# both layouts are matched in a single scan of the file name:
+# groups 1 and 2 belong to dist-info, groups 3 and 4 to egg-info
+info_pattern_compiled = re.compile(f"{dist_info_pattern}|{egg_info_pattern}")
 
+# plain release versions without leading zeros (1.2.3) are already
+# in their normalized form, so there is no need to parse them
+canonical_version_compiled = re.compile(r"(0|[1-9]\d*)(\.(0|[1-9]\d*))*")
 
-def check_if_is_direct_url(package_name: str, url: Optional[str]) -> bool:
+
+PYPI_URL_PREFIXES = (
+    "https://pypi.io/packages/",
+    "https://pypi.org/packages/",
+    "https://pypi.python.org/packages/",
+)
+
+
+def check_if_is_direct_url(package_name: str, url: Optional[str | list[str]]) -> bool:
     if not url:
         return False
     urls = None
@@ -24,67 +38,73 @@ def check_if_is_direct_url(package_name: str, url: Optional[str]) -> bool:
         logging.warning(f"{package_name} contains multiple urls")
         urls = url
     else:
-        urls = list(url)
-
-    if all(
-        url.startswith("https://pypi.io/packages/")
-        or url.startswith("https://pypi.org/packages/")
-        or url.startswith("https://pypi.python.org/packages/")
-        for url in urls
-    ):
+        urls = [url]
+
+    if all(url.startswith(PYPI_URL_PREFIXES) for url in urls):
         return False
 
     return True
 
 
+@functools.lru_cache(maxsize=4096)
+def _normalized_name(package_name: str) -> str:
+    # the same pypi names show up in many artifacts, so we normalize
+    # them once and intern the result to share it across mapping entries
+    return sys.intern(normalize(package_name))
+
+
 def get_pypi_names_and_version(files: list[str]) -> dict[str, str]:
     """
     Return a dictionary of normalized names to it's version
     """
     package_names: dict[str, str] = {}
     for file_name in files:
-        file_path = Path(file_name)
         # sometimes, packages like setuptools have some stuff vendored
         # that our regex will catch:
         # site-packages/setuptools/_vendor/zipp-3.19.2.dist-info/RECORD
-        # but in reality we don't want to include itages:
-        if "_vendor" in file_path.parts or "_vendored" in file_path.parts:
-            continue
-        match = dist_pattern_compiled.search(file_name) or egg_pattern_compiled.search(
-            file_name
-        )
+        # but in reality we don't want to include itages.
+        # the substring check is cheap and rules out almost every file
+        # before we pay for splitting the path into parts
+        if "_vendor" in file_name:
+            file_parts = Path(file_name).parts
+            if "_vendor" in file_parts or "_vendored" in file_parts:
+                continue
+
+        match = info_pattern_compiled.search(file_name)
         if match:
-            package_name = match.group(1)
+            if match.group(1) is not None:
+                package_name, version = match.group(1, 2)
+            else:
+                package_name, version = match.group(3, 4)
+
             if not package_name:
                 continue
 
-            version = match.group(2)
             if "-py" in version:
                 index_of_py = version.index("-py")
                 version = version[:index_of_py]
 
-            pkg_version = None
+            if not canonical_version_compiled.fullmatch(version):
+                pkg_version = None
 
-            try:
-                pkg_version = parse(version)
-            except Exception:
-                if "-" in version:
-                    index_of_dash = version.rfind("-")
-                    version = version[:index_of_dash]
+                try:
+                    pkg_version = parse(version)
+                except Exception:
+                    if "-" in version:
+                        index_of_dash = version.rfind("-")
+                        version = version[:index_of_dash]
 
-            if pkg_version:
-                version = str(pkg_version)
+                if pkg_version:
+                    version = str(pkg_version)
 
-            package_names[normalize(package_name)] = version
+            package_names[_normalized_name(package_name)] = version
 
     return package_names
 
 
 def extract_artifact_mapping(artifact: ArtifactData, package_name: str) -> MappingEntry:
     pypi_names_and_versions = get_pypi_names_and_version(artifact["files"])
-    pypi_normalized_names = (
-        [name for name in pypi_names_and_versions] if pypi_names_and_versions else None
-    )
+    pypi_normalized_names = list(pypi_names_and_versions) or None
     source: Optional[dict] = artifact["rendered_recipe"].get("source", None)
     is_direct_url: Optional[bool] = None
 
@@ -101,14 +121,14 @@ def extract_artifact_mapping(artifact: ArtifactData, package_name: str) -> Mappi
         direct_url = None
     else:
         url = source.get("url", None)
-        direct_url = [str(url)] if isinstance(url, str) else url
-
-    return MappingEntry.model_validate(
-        {
-            "pypi_normalized_names": pypi_normalized_names,
-            "versions": pypi_names_and_versions if pypi_names_and_versions else None,
-            "conda_name": str(conda_name),
-            "package_name": package_name,
-            "direct_url": direct_url,
-        }
+        direct_url = [str(url)] if isinstance(url, str) else [str(u) for u in url]
+
+    # every field is built above with the type MappingEntry declares,
+    # so we can skip pydantic's validation for each artifact
+    return MappingEntry.model_construct(
+        pypi_normalized_names=pypi_normalized_names,
+        versions=pypi_names_and_versions or None,
+        conda_name=str(conda_name),
+        package_name=package_name,
+        direct_url=direct_url,
     )
@@ -1,4 +1,6 @@
 from enum import StrEnum
+from types import MappingProxyType
+from typing import Mapping
 
 
 Url = str
@@ -15,17 +17,24 @@ class SupportedChannels(StrEnum):
     BIOCONDA = "bioconda"
 
 
-class ChannelUrls:
-    _ChannelUrls: dict[SupportedChannels, list[Url]] = {
-        SupportedChannels.CONDA_FORGE: ["https://conda.anaconda.org/conda-forge/"],
-        SupportedChannels.PYTORCH: ["https://conda.anaconda.org/pytorch/"],
-        SupportedChannels.BIOCONDA: ["https://conda.anaconda.org/bioconda/"],
+_CHANNEL_URLS: Mapping[SupportedChannels, tuple[Url, ...]] = MappingProxyType(
+    {
+        SupportedChannels.CONDA_FORGE: ("https://conda.anaconda.org/conda-forge/",),
+        SupportedChannels.PYTORCH: ("https://conda.anaconda.org/pytorch/",),
+        SupportedChannels.BIOCONDA: ("https://conda.anaconda.org/bioconda/",),
     }
+)
+
+_MAIN_CHANNEL_URLS: Mapping[SupportedChannels, Url] = MappingProxyType(
+    {channel: urls[0] for channel, urls in _CHANNEL_URLS.items()}
+)
 
+
+class ChannelUrls:
     @staticmethod
-    def channels(channel: SupportedChannels) -> list[Url]:
-        return ChannelUrls._ChannelUrls[channel]
+    def channels(channel: SupportedChannels) -> tuple[Url, ...]:
+        return _CHANNEL_URLS[channel]
 
     @staticmethod
     def main_channel(channel: SupportedChannels) -> Url:
-        return ChannelUrls._ChannelUrls[channel][0]
+        return _MAIN_CHANNEL_URLS[channel]
@@ -1,5 +1,3 @@
-import re
-from typing import Optional
 import logging
 from parselmouth.internals.artifact import extract_artifact_mapping
 from parselmouth.internals.channels import SupportedChannels
@@ -11,36 +9,6 @@ from parselmouth.internals.s3 import MappingEntry, s3_client
 from rich import print
 
 
-names_mapping: dict[str, dict] = {}
-
-dist_info_pattern = r"([^/]+)-(\d+[^/]*)\.dist-info\/METADATA"
-egg_info_pattern = r"([^/]+?)-(\d+[^/]*)\.egg-info\/PKG-INFO"
-
-dist_pattern_compiled = re.compile(dist_info_pattern)
-egg_pattern_compiled = re.compile(egg_info_pattern)
-
-
-def check_if_is_direct_url(package_name: str, url: Optional[str]) -> bool:
-    if not url:
-        return False
-    urls = None
-    if not isinstance(url, str):
-        logging.warning(f"{package_name} contains multiple urls")
-        urls = url
-    else:
-        urls = list(url)
-
-    if all(
-        url.startswith("https://pypi.io/packages/")
-        or url.startswith("https://pypi.org/packages/")
-        or url.startswith("https://pypi.python.org/packages/")
-        for url in urls
-    ):
-        return False
-
-    return True
-
-
 def main(
     package_name: str,
     subdir: str,
@@ -50,18 +18,13 @@ def main(
 ):
     repodatas = get_all_packages_by_subdir(subdir, channel)
 
-    found_sha = None
-
-    for repodata_package_name in repodatas:
-        if repodata_package_name == package_name:
-            found_sha = repodatas[package_name]["sha256"]
-            break
-
-    if not found_sha:
+    if package_name not in repodatas:
         raise ValueError(
             f"Could not find the package {package_name} in the repodata for subdir {subdir}"
         )
 
+    found_sha = repodatas[package_name]["sha256"]
+
     names_mapping: dict[str, MappingEntry] = {}
     backend_types = (
         [backend_type] if backend_type else ["oci", "streamed", "libcfgraph"]
@@ -71,11 +34,7 @@ def main(
             subdir=subdir, artifact=package_name, backend=backend_type, channel=channel
         )
         if artifact:
-            sha = repodatas[package_name]["sha256"]
-
-            if sha not in names_mapping:
-                mapping_entry = extract_artifact_mapping(artifact, package_name)
-                names_mapping[sha] = mapping_entry
+            names_mapping[found_sha] = extract_artifact_mapping(artifact, package_name)
             break
 
     if not names_mapping:
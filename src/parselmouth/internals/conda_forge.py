@@ -1,5 +1,7 @@
 import requests
+from requests.adapters import HTTPAdapter, Retry
 import logging
+from pydantic_core import from_json
 from conda_forge_metadata.artifact_info.info_json import (
     get_artifact_info_as_json,
     info_json_from_tar_generator,
@@ -9,26 +11,38 @@ from urllib.parse import urljoin
 from parselmouth.internals.channels import ChannelUrls, SupportedChannels
 
 
+# reuse connections to the channel host between channeldata and repodata requests
+session = requests.Session()
+session.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.5),
+    ),
+)
+
+
 def get_all_archs_available(channel: SupportedChannels) -> list[str]:
     channel_url = ChannelUrls.main_channel(channel)
 
-    response = requests.get(urljoin(channel_url, "channeldata.json"))
-    channel_json = response.json()
+    response = session.get(urljoin(channel_url, "channeldata.json"))
+    channel_json = from_json(response.content)
     # Collect all subdirectories
-    subdirs: list[str] = []
+    subdirs: set[str] = set()
     for package in channel_json["packages"].values():
-        subdirs.extend(package.get("subdirs", []))
+        subdirs.update(package.get("subdirs", ()))
 
-    return list(set(subdirs))
+    return list(subdirs)
 
 
-def get_subdir_repodata(
+def download_subdir_repodata(
     subdir: str, channel: SupportedChannels = SupportedChannels.CONDA_FORGE
-) -> dict:
+) -> bytes:
     channel_url = ChannelUrls.main_channel(channel)
 
     subdir_repodata = urljoin(channel_url, f"{subdir}/repodata.json")
-    response = requests.get(subdir_repodata)
+    response = session.get(subdir_repodata)
     if not response.ok:
         logging.error(
             f"Request for repodata to {subdir_repodata} failed. {response.reason}"
@@ -36,22 +50,30 @@ def get_subdir_repodata(
 
     response.raise_for_status()
 
-    return response.json()
+    return response.content
 
 
-def get_all_packages_by_subdir(
+def get_subdir_repodata(
     subdir: str, channel: SupportedChannels = SupportedChannels.CONDA_FORGE
-) -> dict[str, dict]:
-    repodatas: dict[str, dict] = {}
+) -> dict:
+    return from_json(download_subdir_repodata(subdir, channel))
 
-    repodata = get_subdir_repodata(subdir, channel)
 
-    repodatas.update(repodata["packages"])
+def get_packages_from_repodata(repodata: dict) -> dict[str, dict]:
+    # merge into the existing packages dict instead of copying both
+    # into a new one, repodata for big subdirs is hundreds of MB
+    repodatas: dict[str, dict] = repodata["packages"]
     repodatas.update(repodata["packages.conda"])
 
     return repodatas
 
 
+def get_all_packages_by_subdir(
+    subdir: str, channel: SupportedChannels = SupportedChannels.CONDA_FORGE
+) -> dict[str, dict]:
+    return get_packages_from_repodata(get_subdir_repodata(subdir, channel))
+
+
 def get_artifact_info(
     subdir,
     artifact,
@@ -1,4 +1,5 @@
 import json
+from operator import attrgetter
 from typing import Mapping
 from deprecated import deprecated
 
@@ -25,16 +26,12 @@ def format_and_save_mapping(
 
     map_to_save = {}
 
-    mapping = dict(sorted(mapping.items(), key=lambda t: t[0]))
-
-    for conda_name, mapping_value in mapping.items():
-        pypi_names = mapping_value.pypi_name
-        pypi_name = pypi_names[0] if pypi_names else None
-
-        map_to_save[conda_name] = pypi_name
+    for conda_name in sorted(mapping):
+        pypi_names = mapping[conda_name].pypi_name
+        map_to_save[conda_name] = pypi_names[0] if pypi_names else None
 
     with open(f"files/{mapping_name}.json", "w") as map_file:
-        json.dump(map_to_save, map_file)
+        map_file.write(json.dumps(map_to_save))
 
 
 def transform_mapping_in_grayskull_format(existing_mapping: IndexMapping):
@@ -42,11 +39,9 @@ def transform_mapping_in_grayskull_format(existing_mapping: IndexMapping):
 
     compressed_mapping: dict[str, CompressedMapping] = {}
 
-    existing_mapping.root = dict(
-        sorted(existing_mapping.root.items(), key=lambda t: t[1].package_name)
-    )
-
-    for _cas_hash, mapping in existing_mapping.root.items():
+    for mapping in sorted(
+        existing_mapping.root.values(), key=attrgetter("package_name")
+    ):
         conda_name = mapping.conda_name
 
         pypi_name = mapping.pypi_normalized_names
@@ -1,4 +1,5 @@
 import json
+from operator import attrgetter
 import os.path
 
 from pydantic import BaseModel
@@ -23,14 +24,10 @@ def _format_and_save_mapping(
     # now le'ts iterate over created small_mapping
     # and format it for saving in json
     # where conda_name: pypi_names
-    map_to_save = {}
-
-    compressed_mapping = dict(sorted(compressed_mapping.items(), key=lambda t: t[0]))
-
-    for conda_name, mapping in compressed_mapping.items():
-        pypi_names = mapping.pypi_names
-
-        map_to_save[conda_name] = pypi_names
+    map_to_save = {
+        conda_name: compressed_mapping[conda_name].pypi_names
+        for conda_name in sorted(compressed_mapping)
+    }
 
     os.makedirs(os.path.join(FILES_DIR, FILES_VERSION, channel), exist_ok=True)
 
@@ -39,7 +36,8 @@ def _format_and_save_mapping(
     )
 
     with open(mapping_location, "w") as map_file:
-        json.dump(map_to_save, map_file)
+        # dumps uses the C one-shot encoder, dump streams chunks from Python
+        map_file.write(json.dumps(map_to_save))
 
 
 def transform_mapping_and_save(
@@ -47,11 +45,9 @@ def transform_mapping_and_save(
 ):
     compressed_mapping: dict[str, CompressedMapping] = {}
 
-    existing_mapping.root = dict(
-        sorted(existing_mapping.root.items(), key=lambda t: t[1].package_name)
-    )
-
-    for _cas_hash, mapping in existing_mapping.root.items():
+    for mapping in sorted(
+        existing_mapping.root.values(), key=attrgetter("package_name")
+    ):
         conda_name = mapping.conda_name
 
         pypi_names = mapping.pypi_normalized_names
@@ -91,8 +91,7 @@ def main(
 
     repodatas = get_all_packages_by_subdir(subdir, channel)
 
-    for idx, package_name in enumerate(repodatas):
-        package = repodatas[package_name]
+    for package_name, package in repodatas.items():
         sha256 = package["sha256"]
 
         if sha256 in existing_mapping_data.root and any(
@@ -1,3 +1,4 @@
+import functools
 import io
 import logging
 import os
@@ -8,6 +9,7 @@ from botocore.config import Config
 
 
 from pydantic import BaseModel, RootModel
+from pydantic_core import to_json
 
 from parselmouth.internals.channels import SupportedChannels
 
@@ -36,15 +38,21 @@ class S3:
                 "no .env file was loaded. S3 requests may fail until R2_PREFIX_* keys are set."
             )
 
-        account_id = os.getenv("R2_PREFIX_ACCOUNT_ID", "default")
-        access_key_id = os.getenv("R2_PREFIX_ACCESS_KEY_ID", "")
-        access_key_secret = os.getenv("R2_PREFIX_SECRET_ACCESS_KEY", "")
         bucket_name = os.getenv("R2_PREFIX_BUCKET", "conda")
 
         self.bucket_name = bucket_name
 
+    @functools.cached_property
+    def _s3_client(self):
+        # the client is created on first use, so importing this module
+        # (e.g. for MappingEntry) does not pay for botocore's setup
+        account_id = os.getenv("R2_PREFIX_ACCOUNT_ID", "default")
+        access_key_id = os.getenv("R2_PREFIX_ACCESS_KEY_ID", "")
+        access_key_secret = os.getenv("R2_PREFIX_SECRET_ACCESS_KEY", "")
+
         boto_config = Config(
             max_pool_connections=50,
+            tcp_keepalive=True,
         )
 
         s3_client = boto3.client(
@@ -55,7 +63,7 @@ class S3:
             region_name="eeur",  # Must be one of: wnam, enam, weur, eeur, apac, auto
             config=boto_config,
         )
-        self._s3_client = s3_client
+        return s3_client
 
     def get_channel_index(self, channel: SupportedChannels) -> Optional[IndexMapping]:
         assert self._s3_client
@@ -67,19 +75,20 @@ class S3:
         except self._s3_client.exceptions.NoSuchKey:
             return None
 
-        return IndexMapping.model_validate_json(response["Body"].read().decode("utf-8"))
+        return IndexMapping.model_validate_json(response["Body"].read())
 
     def upload_mapping(self, entry: MappingEntry, file_name: str):
-        output = entry.model_dump_json()
-        output_as_file = io.BytesIO(output.encode("utf-8"))
-
-        self._s3_client.upload_fileobj(
-            output_as_file, self.bucket_name, f"hash-{CURRENT_VERSION}/{file_name}"
+        # mappings are tiny, so a single PUT is cheaper than
+        # going through the managed (multipart) transfer
+        self._s3_client.put_object(
+            Bucket=self.bucket_name,
+            Key=f"hash-{CURRENT_VERSION}/{file_name}",
+            Body=to_json(entry),
+            ContentType="application/json",
         )
 
     def upload_index(self, entry: IndexMapping, channel: SupportedChannels):
-        output = entry.model_dump_json()
-        output_as_file = io.BytesIO(output.encode("utf-8"))
+        output_as_file = io.BytesIO(to_json(entry))
 
         self._s3_client.upload_fileobj(
             output_as_file,
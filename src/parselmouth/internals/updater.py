@@ -1,6 +1,4 @@
 import asyncio
-import io
-import json
 import os
 from pathlib import Path
 from typing import Optional
@@ -10,6 +8,7 @@ from conda_forge_metadata.types import ArtifactData
 import concurrent.futures
 import logging
 from dotenv import load_dotenv
+from pydantic_core import from_json, to_json
 
 from parselmouth.internals.artifact import extract_artifact_mapping
 from parselmouth.internals.channels import BackendRequestType, SupportedChannels
@@ -17,7 +16,7 @@ from parselmouth.internals.conda_forge import (
     get_all_packages_by_subdir,
     get_artifact_info,
 )
-from parselmouth.internals.s3 import IndexMapping
+from parselmouth.internals.s3 import IndexMapping, MappingEntry
 
 import aioboto3
 
@@ -26,19 +25,28 @@ from parselmouth.internals.yank import YankConfig
 
 names_mapping: IndexMapping = IndexMapping.model_construct(root={})
 
+# keep the number of in-flight uploads in line with the connection pool
+MAX_CONCURRENT_UPLOADS = 50
+
 
 async def async_upload_package(
-    s3_client, pkg_body: str, package_hash, bucket_name: str
+    s3_client,
+    pkg_body: MappingEntry,
+    package_hash,
+    bucket_name: str,
+    semaphore: asyncio.Semaphore,
 ):
-    try:
-        # output = pkg_body.model_dump_json()
-        output_as_file = io.BytesIO(pkg_body.encode("utf-8"))
-
-        await s3_client.upload_fileobj(
-            output_as_file, bucket_name, f"hash-v0/{package_hash}"
-        )
-    except Exception as e:
-        logging.error(f"could not upload it {package_hash} {e}")
+    async with semaphore:
+        try:
+            # serialize inside the task so only in-flight payloads are kept in memory
+            await s3_client.put_object(
+                Bucket=bucket_name,
+                Key=f"hash-v0/{package_hash}",
+                Body=to_json(pkg_body),
+                ContentType="application/json",
+            )
+        except Exception as e:
+            logging.error(f"could not upload it {package_hash} {e}")
 
 
 async def upload_to_s3(names_mapping: IndexMapping):
@@ -57,8 +65,9 @@ async def upload_to_s3(names_mapping: IndexMapping):
         region_name="eeur",  # Must be one of: wnam, enam, weur, eeur, apac, auto
     )
     config = botocore.client.Config(
-        max_pool_connections=50,
+        max_pool_connections=MAX_CONCURRENT_UPLOADS,
     )
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_UPLOADS)
     async with session.client(
         "s3",
         endpoint_url=f"https://{account_id}.r2.cloudflarestorage.com",
@@ -67,7 +76,7 @@ async def upload_to_s3(names_mapping: IndexMapping):
         tasks = [
             asyncio.ensure_future(
                 async_upload_package(
-                    s3_client, pkg_body.model_dump_json(), package_hash, bucket_name
+                    s3_client, pkg_body, package_hash, bucket_name, semaphore
                 )
             )
             for package_hash, pkg_body in names_mapping.root.items()
@@ -96,19 +105,20 @@ def main(
     all_packages: list[tuple[str, str]] = []
 
     index_location = Path(output_dir) / channel / "index.json"
-    existing_mapping_data = IndexMapping.model_validate_json(index_location.read_text())
+    # we only need to know which hashes are already mapped,
+    # so we skip validating every entry into a MappingEntry
+    existing_entries: dict[str, dict] = from_json(index_location.read_bytes())
 
     repodatas = get_all_packages_by_subdir(subdir, channel)
     total_packages = set()
 
-    for idx, package_name in enumerate(repodatas):
+    for package_name, package in repodatas.items():
         if not package_name.startswith(letter):
             continue
 
-        package = repodatas[package_name]
         sha256 = package["sha256"]
 
-        if sha256 not in existing_mapping_data.root:
+        if sha256 not in existing_entries:
             # trying to get packages info using all backends.
             # note: streamed is not supported for .tar.gz
             if package_name.endswith(".conda"):
@@ -192,7 +202,5 @@ def main(
     partial_output_dir_location = Path(partial_output_dir) / channel
     os.makedirs(partial_output_dir_location, exist_ok=True)
 
-    with open(
-        partial_output_dir_location / partial_json_name, mode="w"
-    ) as mapping_file:
-        json.dump(names_mapping.model_dump(), mapping_file)
+    partial_json_location = partial_output_dir_location / partial_json_name
+    partial_json_location.write_bytes(to_json(names_mapping))
@@ -15,12 +15,16 @@ def main(output_dir: str, channel: SupportedChannels, upload: bool):
 
     output_dir_location = Path(output_dir) / channel
 
-    for filename in os.listdir(output_dir_location):
-        partial_file = Path(output_dir_location) / filename
+    with os.scandir(output_dir_location) as partial_files:
+        for partial_file in partial_files:
+            if not partial_file.is_file():
+                continue
 
-        mapping_entry = IndexMapping.model_validate_json(partial_file.read_text())
-        existing_mapping_data.root.update(mapping_entry.root)
-        total_new_files += 1
+            with open(partial_file.path, "rb") as partial:
+                mapping_entry = IndexMapping.model_validate_json(partial.read())
+
+            existing_mapping_data.root.update(mapping_entry.root)
+            total_new_files += 1
 
     logging.info(f"Total new files {total_new_files}")
 
@@ -1,21 +1,55 @@
+import concurrent.futures
 import json
 import os
 from pathlib import Path
-import re
+from pydantic_core import from_json, to_json
 
 from parselmouth.internals.channels import SupportedChannels
 from parselmouth.internals.conda_forge import (
+    download_subdir_repodata,
     get_all_archs_available,
-    get_subdir_repodata,
+    get_packages_from_repodata,
 )
 from parselmouth.internals.s3 import IndexMapping, s3_client
 
 
-dist_info_pattern = r"([^/]+)-(\d+[^/]*)\.dist-info\/METADATA"
-egg_info_pattern = r"([^/]+?)-(\d+[^/]*)\.egg-info\/PKG-INFO"
+def get_missing_letters(
+    subdir: str, repodata_bytes: bytes, existing_mapping_data: IndexMapping
+) -> set[str]:
+    repodatas = get_packages_from_repodata(from_json(repodata_bytes))
 
-dist_pattern_compiled = re.compile(dist_info_pattern)
-egg_pattern_compiled = re.compile(egg_info_pattern)
+    letters = set()
+
+    for package_name, package in repodatas.items():
+        sha256 = package["sha256"]
+
+        if sha256 not in existing_mapping_data.root:
+            letters.add(f"{subdir}@{package_name[0]}")
+
+    return letters
+
+
+def get_all_missing_letters(
+    subdirs: list[str], channel: SupportedChannels, existing_mapping_data: IndexMapping
+) -> set[str]:
+    letters = set()
+
+    # download the next subdir while the current one is parsed, so only
+    # one parsed repodata is held in memory at a time
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        downloads = (
+            (subdir, executor.submit(download_subdir_repodata, subdir, channel))
+            for subdir in subdirs
+        )
+        next_download = next(downloads, None)
+        while next_download:
+            subdir, download = next_download
+            next_download = next(downloads, None)
+            letters.update(
+                get_missing_letters(subdir, download.result(), existing_mapping_data)
+            )
+
+    return letters
 
 
 def main(
@@ -32,8 +66,6 @@ def main(
     elif subdir and subdir not in subdirs:
         raise ValueError(f"Subdir {subdir} not found in channel {channel}")
 
-    all_packages: list[tuple[str, str]] = []
-
     if check_if_exists:
         existing_mapping_data = s3_client.get_channel_index(channel=channel)
         if not existing_mapping_data:
@@ -42,28 +74,12 @@ def main(
         # a new channel may not have any mapping data. so we need to create an empty one
         existing_mapping_data = IndexMapping(root={})
 
-    letters = set()
-
-    for subdir in subdirs:
-        repodatas = {}
-        repodata = get_subdir_repodata(subdir, channel)
-
-        repodatas.update(repodata["packages"])
-        repodatas.update(repodata["packages.conda"])
-
-        for package_name in repodatas:
-            package = repodatas[package_name]
-            sha256 = package["sha256"]
-
-            if sha256 not in existing_mapping_data.root:
-                all_packages.append(package_name)
-                letters.add(f"{subdir}@{package_name[0]}")
+    letters = get_all_missing_letters(subdirs, channel, existing_mapping_data)
 
     index_location = Path(output_dir) / channel / "index.json"
     os.makedirs(index_location.parent, exist_ok=True)
 
-    with open(index_location, mode="w") as mapping_file:
-        json.dump(existing_mapping_data.model_dump(), mapping_file)
+    index_location.write_bytes(to_json(existing_mapping_data))
 
     json_letters = json.dumps(list(letters))
 
@@ -0,0 +1,35 @@
+from parselmouth.internals.artifact import (
+    check_if_is_direct_url,
+    get_pypi_names_and_version,
+)
+
+
+def test_pypi_url_is_not_direct():
+    url = "https://pypi.io/packages/source/r/requests/requests-2.32.3.tar.gz"
+
+    assert not check_if_is_direct_url("requests", url)
+
+
+def test_github_url_is_direct():
+    url = "https://github.com/psf/requests/archive/v2.32.3.tar.gz"
+
+    assert check_if_is_direct_url("requests", url)
+
+
+def test_multiple_urls_are_direct_if_any_is_not_pypi():
+    urls = [
+        "https://pypi.org/packages/source/r/requests/requests-2.32.3.tar.gz",
+        "https://github.com/psf/requests/archive/v2.32.3.tar.gz",
+    ]
+
+    assert check_if_is_direct_url("requests", urls)
+
+
+def test_get_pypi_names_and_version_normalizes_versions():
+    files = [
+        "lib/python3.12/site-packages/Foo_Bar-1.2.3.dist-info/METADATA",
+        "lib/python3.12/site-packages/baz-01.0-py3.12.egg-info/PKG-INFO",
+        "lib/python3.12/site-packages/setuptools/_vendor/zipp-3.19.2.dist-info/METADATA",
+    ]
+
+    assert get_pypi_names_and_version(files) == {"foo-bar": "1.2.3", "baz": "1.0"}